@@ -0,0 +1,233 @@
+from collections.abc import Iterator
+
+import pandas as pd
+from pandas.api.types import (
+    is_float_dtype,
+    is_integer_dtype,
+    is_string_dtype,
+)
+
+
+# Engine-independent pieces of the data-quality report: missing-value and
+# column classification rules, outlier thresholds and report assembly.
+# Engines only compute the flat "<col>__<stat>" numbers.
+
+NULL_LIKE_STRINGS = {"nan", "none", "null"}
+
+# report sections that can be requested via `checks`
+ALL_CHECKS = ("missing", "numeric", "uniqueness")
+
+
+# -------------------
+# Helper Functions
+# -------------------
+
+def missing_kind(dtype) -> str:
+    """
+    Dtype kind used to look up the missing-value rule. Extension dtypes report
+    the kind of their values (e.g. "O" for StringDtype, "b" for BooleanDtype);
+    categoricals also report "O" but are not strings, so they get no kind.
+    Arrow-backed strings (`pd.ArrowDtype(pa.string())`) report "U" and are
+    mapped to "O" like the other string dtypes.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return ""
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and is_string_dtype(dtype):
+        return "O"
+    return dtype.kind
+
+
+def needs_uniqueness_check(col: str, dtype) -> bool:
+    """
+    Decide whether this column should get a uniqueness check.
+    - all string-like columns
+    - any column whose name contains 'id' (case-insensitive)
+    """
+    name = col.lower()
+    if "id" in name:
+        return True
+    if is_string_dtype(dtype):
+        return True
+    return False
+
+
+def numeric_columns(df: pd.DataFrame) -> list[str]:
+    return [
+        col
+        for col, dtype in df.dtypes.items()
+        if is_integer_dtype(dtype) or is_float_dtype(dtype)
+    ]
+
+
+def uniqueness_columns(df: pd.DataFrame) -> set[str]:
+    return {col for col, dtype in df.dtypes.items() if needs_uniqueness_check(col, dtype)}
+
+
+def classify_columns(
+    df: pd.DataFrame,
+    checks: tuple[str, ...] = ALL_CHECKS,
+) -> tuple[list[str], set[str]]:
+    """
+    Return (numeric columns in frame order, columns needing a uniqueness check),
+    empty for sections not listed in `checks`. Engines compute this once per
+    report and pass it to their query builders and `iter_column_reports`.
+    """
+    numeric_cols = numeric_columns(df) if "numeric" in checks else []
+    unique_cols = uniqueness_columns(df) if "uniqueness" in checks else set()
+    return numeric_cols, unique_cols
+
+
+def iqr_columns(numeric_cols: list[str], custom_numeric_ranges: dict[str, tuple] | None) -> list[str]:
+    return [
+        col
+        for col in numeric_cols
+        if not (custom_numeric_ranges and col in custom_numeric_ranges)
+    ]
+
+
+def normalize_checks(checks: str | tuple[str, ...]) -> tuple[str, ...]:
+    """Validate `checks` and return it as a tuple (a single name may be passed as a string)."""
+    if isinstance(checks, str):
+        checks = (checks,)
+    checks = tuple(checks)
+    unknown = set(checks) - set(ALL_CHECKS)
+    if unknown:
+        raise ValueError(f"Unknown checks: {sorted(unknown)} (expected any of {ALL_CHECKS})")
+    return checks
+
+
+def outlier_thresholds(
+    numeric_cols: list[str],
+    quantiles: dict[str, tuple[float, float] | None],
+    custom_numeric_ranges: dict[str, tuple] | None = None,
+) -> dict[str, tuple[str, float, float]]:
+    """
+    Decide outlier thresholds per numeric column (custom range if provided, IQR otherwise).
+    Returns {col: (method, lower_threshold, upper_threshold)}; columns without
+    usable quartiles are left out.
+    """
+    thresholds = {}
+    for col in numeric_cols:
+        if custom_numeric_ranges and col in custom_numeric_ranges:
+            lower_thresh, upper_thresh = custom_numeric_ranges[col]
+            thresholds[col] = ("custom_range", float(lower_thresh), float(upper_thresh))
+        elif quantiles.get(col) is not None:
+            q1, q3 = quantiles[col]
+            iqr = q3 - q1
+            thresholds[col] = ("IQR_1.5", q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+    return thresholds
+
+
+def compute_numeric_overview(
+    col: str,
+    dtype,
+    stats: dict,
+    thresholds: dict[str, tuple[str, float, float]],
+    outlier_counts: dict[str, tuple[int, int, int]],
+) -> dict | None:
+    """
+    Assemble neutral statistics for numeric columns:
+    - count non-finite values (NaN, ±inf)
+    - count negative values
+    - IQR-based or custom-range outlier counts
+
+    All numbers are precomputed for every column at once by the engine (e.g.
+    `duckdb_engine.build_stats_query`), so this does not touch the data.
+    """
+    # only for numeric columns
+    if not (is_integer_dtype(dtype) or is_float_dtype(dtype)):
+        return None
+
+    # 1) basic counts: non-finite + negatives
+    overview = {
+        "total_rows": int(stats["total_rows"]),
+        "N_non_finite": int(stats[f"{col}__nonfinite"] or 0),
+        "N_negative": int(stats[f"{col}__neg"] or 0),
+        "outliers": None,
+    }
+
+    # 2) column is all NULL / non-finite – nothing to do
+    if col not in thresholds:
+        return overview
+
+    # 3) outlier counts (finite, non-null only)
+    method, lower_thresh, upper_thresh = thresholds[col]
+    n_finite, n_below_lower, n_above_upper = outlier_counts[col]
+    overview["outliers"] = {
+        "method": method,
+        "lower_threshold": float(lower_thresh),
+        "upper_threshold": float(upper_thresh),
+        "N_finite_used": n_finite,
+        "N_below_lower": n_below_lower,
+        "N_above_upper": n_above_upper,
+    }
+    return overview
+
+
+# -----------------------
+# Report assembly
+# -----------------------
+
+def iter_column_reports(
+    df: pd.DataFrame,
+    stats: dict,
+    thresholds: dict[str, tuple[str, float, float]],
+    outlier_counts: dict[str, tuple[int, int, int]],
+    exact_uniqueness: bool = False,
+    checks: tuple[str, ...] = ALL_CHECKS,
+    column_sets: tuple[list[str], set[str]] | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Assemble the per-column report dicts from precomputed numbers and yield
+    (column, column_report) pairs. Shared by all engines that produce the flat
+    "<col>__<stat>" stats layout. Sections not listed in `checks` are left out
+    of "issues". `column_sets` is the engine's `classify_columns` result
+    (computed here if not given).
+    """
+    total = stats["total_rows"]
+
+    # dtype dispatch once up front, not per column inside the loop
+    numeric_cols, unique_cols = column_sets or classify_columns(df, checks)
+    numeric_cols = set(numeric_cols)
+
+    for col, dtype in df.dtypes.items():
+        col_report = {
+            "dtype": str(dtype),
+            "issues": {},
+        }
+
+        # --- 1) Missing data ---
+        if "missing" in checks:
+            missing = stats[f"{col}__missing"] or 0
+            pct_missing = round((missing / total) * 100, 2) if total else 0.0
+
+            col_report["issues"]["missing_values"] = {
+                "N_missing": int(missing),
+                "pct_missing": pct_missing,
+            }
+
+        # --- numeric overview (only for numeric columns) ---
+        if "numeric" in checks:
+            numeric_info = None
+            if col in numeric_cols:
+                numeric_info = compute_numeric_overview(col, dtype, stats, thresholds, outlier_counts)
+            col_report["issues"]["numeric_overview"] = numeric_info
+
+        # --- 3) Uniqueness (selected columns only) ---
+        if "uniqueness" in checks:
+            if col in unique_cols:
+                # HyperLogLog estimates can overshoot; there can't be more values than rows
+                n_unique = min(stats[f"{col}__nunique"], total)
+                pct_unique = (
+                    round((n_unique / total) * 100, 2) if total else 0.0
+                )
+
+                unique_key = "N_unique" if exact_uniqueness else "N_unique_approx"
+                col_report["issues"]["uniqueness"] = {
+                    unique_key: int(n_unique),
+                    "pct_unique": pct_unique,
+                }
+            else:
+                col_report["issues"]["uniqueness"] = None
+
+        yield col, col_report
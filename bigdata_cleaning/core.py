@@ -1,10 +1,25 @@
+from .common import ALL_CHECKS, normalize_checks
+
 
 # Logic for loading check data functions from engines
-def check_data(df, engine="duckdb", custom_numeric_ranges=None):
+# (checks selects the report sections; extra keyword arguments are passed through to the engine)
+def check_data(
+    df,
+    engine="duckdb",
+    custom_numeric_ranges=None,
+    checks=ALL_CHECKS,
+    **kwargs,
+):
     if engine == "duckdb":
         from .duckdb_engine import check_duckdb
-        return check_duckdb(df, custom_numeric_ranges)
+        return check_duckdb(df, custom_numeric_ranges, checks=checks, **kwargs)
+    elif engine == "polars":
+        from .polars_engine import check_polars
+        return check_polars(df, custom_numeric_ranges, checks=checks, **kwargs)
     elif engine == "spark":
+        # the spark engine doesn't support report sections or extra options yet
+        if kwargs or set(normalize_checks(checks)) != set(ALL_CHECKS):
+            raise ValueError("The spark engine doesn't support `checks` or extra keyword arguments yet")
         from .spark_engine import check_spark
         return check_spark(df, custom_numeric_ranges)
     else:
@@ -15,8 +30,11 @@ def fix_data(df, engine="duckdb"):
     if engine == "duckdb":
         from .duckdb_engine import fix_duckdb
         return fix_duckdb(df)
+    elif engine == "polars":
+        from .polars_engine import fix_polars
+        return fix_polars(df)
     elif engine == "spark":
         from .spark_engine import fix_spark
         return fix_spark(df)
     else:
-        raise ValueError(f"Unknown engine: {engine}")
\ No newline at end of file
+        raise ValueError(f"Unknown engine: {engine}")
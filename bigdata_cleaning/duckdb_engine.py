@@ -1,233 +1,797 @@
+import os
+import threading
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import numpy as np
 import pandas as pd
-from pandas.api.types import (
-    is_bool_dtype,
-    is_float_dtype,
-    is_integer_dtype,
-    is_string_dtype,
-    is_datetime64_any_dtype,
+import pyarrow as pa
+
+from .common import (
+    ALL_CHECKS,
+    NULL_LIKE_STRINGS,
+    classify_columns,
+    iqr_columns,
+    iter_column_reports,
+    missing_kind,
+    normalize_checks,
+    outlier_thresholds,
 )
 
+try:
+    import numba  # optional: fused kernel for numeric columns in the fast path
+except ImportError:
+    numba = None
+
+
+# frames with fewer rows are checked directly on the NumPy arrays (see check_duckdb)
+FAST_PATH_MAX_ROWS = 1_000_000
+
+# frames with at least this many rows are copied into a native DuckDB temp table
+# before querying; below that the load cost doesn't pay off
+MATERIALIZE_MIN_ROWS = 100_000
+
 
 # -------------------
 # Helper Functions
 # -------------------
 
-def build_missing_condition(col: str, dtype) -> str:
+def qi(name: str) -> str:
+    """
+    Quote an identifier for DuckDB SQL, so column names with spaces,
+    reserved words or quotes are safe to interpolate.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+# missing-value SQL templates keyed by numpy dtype kind ("{c}" is the quoted column)
+_MISSING_TEMPLATES = {
+    # booleans, ints, datetimes: only NULL is missing
+    "b": "{c} IS NULL",
+    "i": "{c} IS NULL",
+    "u": "{c} IS NULL",
+    "M": "{c} IS NULL",
+    # floats: NULL or NaN
+    "f": "{c} IS NULL OR isnan({c})",
+    # strings / objects: NULL, empty, or typical "null-like" markers
+    "O": (
+        "{c} IS NULL "
+        "OR trim({c}) = '' "
+        "OR lower(trim({c})) IN ('nan', 'none', 'null')"
+    ),
+}
+
+
+def _category_code_columns(df: pd.DataFrame) -> dict[str, str]:
+    """
+    Names of the helper columns holding the integer codes of the categorical
+    columns, keyed by column. Each name is guaranteed not to clash with a real
+    column (or another helper column).
+    """
+    taken = {str(col) for col in df.columns}
+    names = {}
+    for col, dtype in df.dtypes.items():
+        if not isinstance(dtype, pd.CategoricalDtype):
+            continue
+        name = base = f"__bdc_code__{col}"
+        i = 1
+        while name in taken:
+            name = f"{base}_{i}"
+            i += 1
+        taken.add(name)
+        names[col] = name
+    return names
+
+
+def _missing_category_codes(dtype: pd.CategoricalDtype) -> list[int]:
+    """
+    Codes of the categories that are "null-like" strings (empty, 'nan', 'none',
+    'null'). Only spaces are stripped, like DuckDB's trim() on string columns.
+    """
+    return [
+        i
+        for i, cat in enumerate(dtype.categories)
+        if isinstance(cat, str) and cat.strip(" ").lower() in NULL_LIKE_STRINGS | {""}
+    ]
+
+
+def build_missing_condition(col: str, dtype, code_col: str | None = None) -> str:
     """
     Return a DuckDB boolean expression that is TRUE when the value is considered "missing".
+    Categorical columns need `code_col`, the name of their helper codes column
+    (see `_category_code_columns`).
     """
-    if is_bool_dtype(dtype):
-        # booleans: only NULL is missing
-        return f"{col} IS NULL"
+    if isinstance(dtype, pd.CategoricalDtype):
+        # categoricals: the null-like categories are resolved in Python, so the
+        # check is a plain integer comparison on the codes column (-1 = NULL)
+        code = qi(code_col)
+        missing_codes = _missing_category_codes(dtype)
+        if not missing_codes:
+            return f"{code} = -1"
+        return f"{code} = -1 OR {code} IN ({', '.join(map(str, missing_codes))})"
+
+    return _MISSING_TEMPLATES.get(missing_kind(dtype), "{c} IS NULL").format(c=qi(col))
 
-    elif is_float_dtype(dtype):
-        # floats: NULL or NaN
-        return f"{col} IS NULL OR isnan({col})"
 
-    elif is_integer_dtype(dtype):
-        # ints: only NULL (no NaN)
-        return f"{col} IS NULL"
+def _collect_numeric_quantiles(
+    con,
+    numeric_cols: list[str],
+    exact: bool = False,
+    table: str = "data_table",
+) -> dict[str, tuple[float, float] | None]:
+    """
+    Compute q1/q3 (finite, non-null values only) for all given numeric columns
+    in a single scan. Columns without any finite value map to None.
 
-    elif is_string_dtype(dtype):
-        # strings: NULL, empty, or typical "null-like" markers
-        return (
-            f"{col} IS NULL "
-            f"OR trim({col}) = '' "
-            f"OR lower(trim({col})) IN ('nan', 'none', 'null')"
+    By default the quartiles are approximated with a t-digest (`approx_quantile`,
+    streaming, constant memory); `exact=True` uses `quantile_cont`, which sorts
+    each column.
+    """
+    if not numeric_cols:
+        return {}
+
+    func = "quantile_cont" if exact else "approx_quantile"
+    exprs = [
+        f"{func}({qi(col)}, [0.25, 0.75]) "
+        f"FILTER (WHERE {qi(col)} IS NOT NULL AND isfinite({qi(col)})) "
+        f"AS {qi(col + '__quartiles')}"
+        for col in numeric_cols
+    ]
+    query = "SELECT\n    " + ",\n    ".join(exprs) + f"\nFROM {qi(table)}"
+    row = con.execute(query).fetchone()
+
+    quantiles = {}
+    for col, quartiles in zip(numeric_cols, row):
+        if quartiles is None or quartiles[0] is None or quartiles[1] is None:
+            quantiles[col] = None
+        else:
+            quantiles[col] = (float(quartiles[0]), float(quartiles[1]))
+    return quantiles
+
+
+def _collect_numeric_outlier_counts(
+    con,
+    thresholds: dict[str, tuple[str, float, float]],
+    table: str = "data_table",
+) -> dict[str, tuple[int, int, int]]:
+    """
+    Count finite values and values below/above the thresholds for all given
+    columns in a single scan. Returns {col: (n_finite, n_below_lower, n_above_upper)}.
+    """
+    if not thresholds:
+        return {}
+
+    # thresholds are bound as parameters, so the query text only depends on the columns
+    exprs = []
+    params = []
+    for col, (_, lower_thresh, upper_thresh) in thresholds.items():
+        c = qi(col)
+        finite = f"{c} IS NOT NULL AND isfinite({c})"
+        exprs.append(f"COUNT(*) FILTER (WHERE {finite}) AS {qi(col + '__finite')}")
+        exprs.append(
+            f"COUNT(*) FILTER (WHERE {finite} AND {c} < ?) "
+            f"AS {qi(col + '__below')}"
+        )
+        exprs.append(
+            f"COUNT(*) FILTER (WHERE {finite} AND {c} > ?) "
+            f"AS {qi(col + '__above')}"
         )
+        params.extend([lower_thresh, upper_thresh])
+    query = "SELECT\n    " + ",\n    ".join(exprs) + f"\nFROM {qi(table)}"
+    row = con.execute(query, params).fetchone()
+
+    counts = {}
+    for i, col in enumerate(thresholds):
+        n_finite, n_below, n_above = row[3 * i: 3 * i + 3]
+        counts[col] = (int(n_finite or 0), int(n_below or 0), int(n_above or 0))
+    return counts
+
+
+def build_stats_query(
+    df: pd.DataFrame,
+    exact_uniqueness: bool = False,
+    skip_distinct: set[str] | frozenset[str] = frozenset(),
+    checks: tuple[str, ...] = ALL_CHECKS,
+    table: str = "data_table",
+    column_sets: tuple[list[str], set[str]] | None = None,
+) -> str:
+    """
+    Build a single SELECT that computes, for every column at once:
+    - missing counts
+    - non-finite and negative counts (numeric columns)
+    - distinct counts (columns that need a uniqueness check), approximate
+      (HyperLogLog) unless `exact_uniqueness` is set; columns in `skip_distinct`
+      are left out (their counts come from elsewhere, e.g. SUMMARIZE)
 
-    elif is_datetime64_any_dtype(dtype):
-        # datetimes: only NULL
-        return f"{col} IS NULL"
+    Sections not listed in `checks` are left out of the SELECT. `column_sets`
+    is the caller's `classify_columns` result (computed here if not given).
 
-    # fallback for unknown types
-    return f"{col} IS NULL"
+    Result columns are named "<col>__<stat>" so they can be unpacked by name.
+    """
+    numeric_cols, unique_cols = column_sets or classify_columns(df, checks)
+    numeric_cols = set(numeric_cols)
+    code_cols = _category_code_columns(df)
+    exprs = ["COUNT(*) AS total_rows"]
+
+    for col, dtype in df.dtypes.items():
+        c = qi(col)
+        if "missing" in checks:
+            missing_cond = build_missing_condition(col, dtype, code_cols.get(col))
+            exprs.append(
+                f"COUNT(*) FILTER (WHERE {missing_cond}) AS {qi(col + '__missing')}"
+            )
+
+        if col in numeric_cols:
+            exprs.append(
+                f"COUNT(*) FILTER (WHERE {c} IS NOT NULL AND NOT isfinite({c})) "
+                f"AS {qi(col + '__nonfinite')}"
+            )
+            exprs.append(
+                f"COUNT(*) FILTER (WHERE {c} < 0) AS {qi(col + '__neg')}"
+            )
+
+        if col in unique_cols and col not in skip_distinct:
+            distinct = f"COUNT(DISTINCT {c})" if exact_uniqueness else f"approx_count_distinct({c})"
+            exprs.append(f"{distinct} AS {qi(col + '__nunique')}")
+
+    return "SELECT\n    " + ",\n    ".join(exprs) + f"\nFROM {qi(table)}"
+
+
+def _category_codes(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Integer codes of all categorical columns, keyed by their helper column name."""
+    return {
+        name: df[col].cat.codes.to_numpy()
+        for col, name in _category_code_columns(df).items()
+    }
 
 
-def compute_numeric_overview(
-    con,
+def _to_arrow(df: pd.DataFrame) -> pa.Table | pd.DataFrame:
+    """
+    Convert the DataFrame to an Arrow table once, so DuckDB can scan its buffers
+    directly instead of decoding Python objects (e.g. strings) on every query.
+    Falls back to the DataFrame itself if the columns can't be converted
+    (e.g. object columns with mixed types).
+
+    Categorical columns get an extra helper column with their codes (named by
+    `_category_code_columns`), used by `build_missing_condition`.
+    """
+    codes = _category_codes(df)
+
+    # DuckDB can't scan half floats from Arrow, nor second / millisecond
+    # durations containing NaT: widen those (losslessly) first
+    widened = {}
+    for col, dtype in df.dtypes.items():
+        if not isinstance(dtype, np.dtype):
+            continue
+        if dtype == np.float16:
+            widened[col] = "float32"
+        elif dtype.kind == "m" and np.datetime_data(dtype)[0] in ("s", "ms"):
+            widened[col] = "timedelta64[us]"
+    if widened:
+        df = df.astype(widened)
+
+    try:
+        tbl = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return df.assign(**codes) if codes else df
+
+    for name, values in codes.items():
+        tbl = tbl.append_column(name, pa.array(values))
+    return tbl
+
+
+def _collect_summarize(con, cols: list[str], table: str = "data_table") -> dict[str, dict]:
+    """
+    Run DuckDB's SUMMARIZE over the given columns (one fused scan) and return
+    {col: {"approx_unique": ..., "q25": ..., "q75": ..., ...}}.
+    Raises duckdb.Error if SUMMARIZE is unavailable or fails (e.g. std overflow on ±inf).
+    """
+    if not cols:
+        return {}
+
+    cur = con.execute(f"SUMMARIZE SELECT {', '.join(qi(col) for col in cols)} FROM {qi(table)}")
+    names = [d[0] for d in cur.description]
+    rows = [dict(zip(names, row)) for row in cur.fetchall()]
+    return {row["column_name"]: row for row in rows}
+
+
+def fetch_named_row(con, query: str) -> dict:
+    """Run a query returning a single row and return it as {column_name: value}."""
+    cur = con.execute(query)
+    row = cur.fetchone()
+    names = [d[0] for d in cur.description]
+    return dict(zip(names, row))
+
+
+# -----------------------
+# NumPy fast path
+# -----------------------
+# For small frames the DuckDB register + plan overhead dominates the actual
+# aggregation, so the same numbers are computed directly on the arrays.
+# The helpers return the same structures as the DuckDB collectors above.
+
+def _numeric_values_np(series: pd.Series) -> np.ndarray:
+    """Return a numeric column as a float64 array, with NULL / NA as NaN."""
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _missing_np(series: pd.Series, dtype) -> int:
+    """NumPy/pandas counterpart of `build_missing_condition`."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        missing_codes = [-1] + _missing_category_codes(dtype)
+        return int(np.isin(series.cat.codes.to_numpy(), missing_codes).sum())
+
+    missing = series.isna()
+    n_missing = int(missing.sum())
+
+    if missing_kind(dtype) == "O":
+        # only spaces, like DuckDB's trim()
+        stripped = series[~missing].astype(str).str.strip(" ")
+        null_like = stripped.eq("") | stripped.str.lower().isin(NULL_LIKE_STRINGS)
+        n_missing += int(null_like.sum())
+
+    return n_missing
+
+
+def _nonfinite_np(values: np.ndarray) -> int:
+    """Count ±inf (NaN counts as missing, like NULL in DuckDB)."""
+    return int(np.isinf(values).sum())
+
+
+def _neg_np(values: np.ndarray) -> int:
+    """Count negative values (including -inf)."""
+    return int((values < 0).sum())
+
+
+def _numeric_overview_kernel(arr: np.ndarray, lower_thresh: float, upper_thresh: float) -> tuple:
+    """
+    Single pass over a numeric array. Returns
+    (n_missing, n_negative, n_non_finite, n_finite, n_below_lower, n_above_upper),
+    where NaN counts as missing and only finite values are compared to the thresholds.
+    """
+    n_missing = n_negative = n_non_finite = n_finite = n_below = n_above = 0
+    for i in range(arr.shape[0]):
+        v = arr[i]
+        if np.isnan(v):
+            n_missing += 1
+            continue
+        if v < 0:
+            n_negative += 1
+        if np.isinf(v):
+            n_non_finite += 1
+            continue
+        n_finite += 1
+        if v < lower_thresh:
+            n_below += 1
+        elif v > upper_thresh:
+            n_above += 1
+    return n_missing, n_negative, n_non_finite, n_finite, n_below, n_above
+
+
+# compiled kernels per array dtype (see `_get_numba_kernel`)
+_NUMBA_KERNEL_CACHE: dict = {}
+
+
+def _get_numba_kernel(dtype: np.dtype):
+    """
+    Return the jitted `_numeric_overview_kernel` for this dtype, compiling it on
+    first use. `nogil` lets the fast path's thread pool run columns in parallel.
+    """
+    kernel = _NUMBA_KERNEL_CACHE.get(dtype)
+    if kernel is None:
+        kernel = numba.njit(nogil=True, cache=True)(_numeric_overview_kernel)
+        _NUMBA_KERNEL_CACHE[dtype] = kernel
+    return kernel
+
+
+def compute_numeric_overview_numba(
     col: str,
-    dtype,
+    series: pd.Series,
     custom_range: tuple[float, float] | None = None,
-) -> dict | None:
-    """
-    Compute neutral statistics for numeric columns:
-    - count non-finite values (NaN, ±inf)
-    - count negative values
-    - IQR-based or custom-range outlier counts
-    """
-    # only for numeric columns
-    if not (is_integer_dtype(dtype) or is_float_dtype(dtype)):
-        return None
-
-    # 1) basic counts: non-finite + negatives
-    query_counts = f"""
-        SELECT
-            COUNT(*) AS total_rows,
-            SUM(
-                CASE
-                    WHEN {col} IS NOT NULL AND NOT isfinite({col}) THEN 1
-                    ELSE 0
-                END
-            ) AS n_non_finite,
-            SUM(
-                CASE
-                    WHEN {col} < 0 THEN 1
-                    ELSE 0
-                END
-            ) AS n_negative
-        FROM data_table;
-    """
-    total_rows, n_non_finite, n_negative = con.execute(query_counts).fetchone()
-
-    # 2) decide thresholds (IQR by default, custom if provided)
-    if custom_range is not None:
-        lower_thresh, upper_thresh = custom_range
-        method = "custom_range"
+) -> tuple[dict, tuple[str, float, float] | None, tuple[int, int, int] | None]:
+    """
+    Numba version of the numeric part of `_process_column_np`: after the
+    quartiles (if needed), all counts come from one fused pass over the array.
+    """
+    dtype = series.dtype
+    if (
+        isinstance(dtype, np.dtype)
+        and dtype.isnative
+        and (dtype.kind in "iu" or dtype in (np.float32, np.float64))
+    ):
+        # plain numpy column numba can compile for: use the buffer as-is (no
+        # float copy); float16, byte-swapped etc. go through float64 below
+        values = series.to_numpy()
     else:
-        # quartiles on finite, non-null values only
-        query_quantiles = f"""
-            SELECT
-                quantile({col}, 0.25) AS q1,
-                quantile({col}, 0.75) AS q3
-            FROM data_table
-            WHERE {col} IS NOT NULL AND isfinite({col});
-        """
-        q1, q3 = con.execute(query_quantiles).fetchone()
-
-        if q1 is None or q3 is None:
-            # column is all NULL / non-finite – nothing to do
-            return {
-                "total_rows": int(total_rows),
-                "N_non_finite": int(n_non_finite),
-                "N_negative": int(n_negative),
-                "outliers": None,
-            }
-
-        iqr = float(q3 - q1)
-        lower_thresh = float(q1 - 1.5 * iqr)
-        upper_thresh = float(q3 + 1.5 * iqr)
-        method = "IQR_1.5"
-
-    # 3) outlier counts (finite, non-null only)
-    query_outliers = f"""
-        SELECT
-            COUNT(*) AS n_finite,
-            SUM(CASE WHEN {col} < {lower_thresh} THEN 1 ELSE 0 END) AS n_below_lower,
-            SUM(CASE WHEN {col} > {upper_thresh} THEN 1 ELSE 0 END) AS n_above_upper
-        FROM data_table
-        WHERE {col} IS NOT NULL AND isfinite({col});
-    """
-    n_finite, n_below_lower, n_above_upper = con.execute(query_outliers).fetchone()
+        values = _numeric_values_np(series)
 
-    return {
-        "total_rows": int(total_rows),
-        "N_non_finite": int(n_non_finite),
-        "N_negative": int(n_negative),
-        "outliers": {
-            "method": method,
-            "lower_threshold": float(lower_thresh),
-            "upper_threshold": float(upper_thresh),
-            "N_finite_used": int(n_finite),
-            "N_below_lower": int(n_below_lower),
-            "N_above_upper": int(n_above_upper),
-        },
+    if custom_range is not None:
+        threshold = outlier_thresholds([col], {}, {col: custom_range})[col]
+    else:
+        # quartiles with linear interpolation, like quantile_cont
+        finite = values if values.dtype.kind in "iu" else values[np.isfinite(values)]
+        quantiles = {col: None}
+        if finite.size:
+            q1, q3 = np.quantile(finite, [0.25, 0.75])
+            quantiles[col] = (float(q1), float(q3))
+        threshold = outlier_thresholds([col], quantiles).get(col)
+
+    lower_thresh, upper_thresh = (threshold[1], threshold[2]) if threshold else (-np.inf, np.inf)
+    kernel = _get_numba_kernel(values.dtype)
+    n_missing, n_negative, n_non_finite, n_finite, n_below, n_above = kernel(
+        values, lower_thresh, upper_thresh
+    )
+
+    stats = {
+        f"{col}__missing": int(n_missing),
+        f"{col}__nonfinite": int(n_non_finite),
+        f"{col}__neg": int(n_negative),
     }
+    if threshold is None:
+        return stats, None, None
+    return stats, threshold, (int(n_finite), int(n_below), int(n_above))
 
 
-def needs_uniqueness_check(col: str, dtype) -> bool:
+def _process_column_np(
+    col: str,
+    series: pd.Series,
+    dtype,
+    is_numeric: bool,
+    check_uniqueness: bool,
+    custom_range: tuple[float, float] | None = None,
+    checks: tuple[str, ...] = ALL_CHECKS,
+) -> tuple[dict, tuple[str, float, float] | None, tuple[int, int, int] | None]:
     """
-    Decide whether this column should get a uniqueness check.
-    - all string-like columns
-    - any column whose name contains 'id' (case-insensitive)
+    Compute all numbers (for the requested `checks`) for a single column without DuckDB.
+    `is_numeric` / `check_uniqueness` come from the caller's `classify_columns`.
+    Returns (stats, threshold, outlier_counts) in the same shape as the DuckDB
+    collectors use for this column; threshold / outlier_counts are None when
+    there is nothing to count (non-numeric or no finite values).
     """
-    name = col.lower()
-    if "id" in name:
-        return True
-    if is_string_dtype(dtype):
-        return True
-    return False
+    stats = {}
+
+    if check_uniqueness:
+        # exact distinct count
+        stats[f"{col}__nunique"] = int(series.nunique(dropna=True))
+
+    if is_numeric and numba is not None:
+        # the fused kernel yields the missing count as well
+        numeric_stats, threshold, counts = compute_numeric_overview_numba(col, series, custom_range)
+        stats.update(numeric_stats)
+        return stats, threshold, counts
+
+    if "missing" in checks:
+        stats[f"{col}__missing"] = _missing_np(series, dtype)
+    if not is_numeric:
+        return stats, None, None
+
+    values = _numeric_values_np(series)
+    stats[f"{col}__nonfinite"] = _nonfinite_np(values)
+    stats[f"{col}__neg"] = _neg_np(values)
+
+    finite = values[np.isfinite(values)]
+
+    # quartiles with linear interpolation, like quantile_cont
+    quantiles = {col: None}
+    if custom_range is None and finite.size:
+        q1, q3 = np.quantile(finite, [0.25, 0.75])
+        quantiles[col] = (float(q1), float(q3))
+
+    custom_ranges = {col: custom_range} if custom_range is not None else None
+    threshold = outlier_thresholds([col], quantiles, custom_ranges).get(col)
+    if threshold is None:
+        return stats, None, None
+
+    _, lower_thresh, upper_thresh = threshold
+    counts = (
+        int(finite.size),
+        int((finite < lower_thresh).sum()),
+        int((finite > upper_thresh).sum()),
+    )
+    return stats, threshold, counts
 
 
 # -----------------------
 # Main engine functions
 # -----------------------
 
-def check_duckdb(df: pd.DataFrame, custom_numeric_ranges: dict[str, tuple] | None = None) -> dict:
-    import duckdb
+# shared in-memory connection, opened lazily and reused across calls (see `_get_conn`)
+_CONN = None
+_CONN_LOCK = threading.Lock()
 
-    report: dict = {}
 
-    con = duckdb.connect()
-    try:
-        # make the DataFrame available as "data_table" inside DuckDB
-        con.register("data_table", df)
-
-        for col, dtype in df.dtypes.items():
-            col_report = {
-                "dtype": str(dtype),
-                "issues": {
-                    "missing_values": {},
-                    "numeric_overview": {},
-                    "uniqueness": {},
-                },
-            }
-
-            # --- 1) Missing data ---
-            missing_cond = build_missing_condition(col, dtype)
-            query_missing = f"""
-                SELECT
-                    COUNT(*) AS total,
-                    SUM(CASE WHEN {missing_cond} THEN 1 ELSE 0 END) AS missing
-                FROM data_table
-            """
-            total, missing = con.execute(query_missing).fetchone()
-            pct_missing = round((missing / total) * 100, 2) if total else 0.0
-
-            col_report["issues"]["missing_values"] = {
-                "N_missing": int(missing),
-                "pct_missing": pct_missing,
-            }
-
-            # --- numeric overview (only for numeric columns) ---
-            custom_range = None
-            if custom_numeric_ranges and col in custom_numeric_ranges:
-                custom_range = custom_numeric_ranges[col]
-
-            numeric_info = compute_numeric_overview(con, col, dtype, custom_range)
-            col_report["issues"]["numeric_overview"] = numeric_info
-
-            # --- 3) Uniqueness (selected columns only) ---
-            if needs_uniqueness_check(col, dtype):
-                query_unique = f"""
-                    SELECT
-                        COUNT(*) AS total,
-                        COUNT(DISTINCT {col}) AS n_unique
-                    FROM data_table
-                """
-                total_u, n_unique = con.execute(query_unique).fetchone()
-                pct_unique = (
-                    round((n_unique / total_u) * 100, 2) if total_u else 0.0
-                )
+def _get_conn():
+    """Return the module-wide DuckDB connection, opening it on first use."""
+    global _CONN
+    with _CONN_LOCK:
+        if _CONN is None:
+            _CONN = duckdb.connect(":memory:", config={"threads": os.cpu_count() or 1})
+        return _CONN
 
-                col_report["issues"]["uniqueness"] = {
-                    "N_unique": int(n_unique),
-                    "pct_unique": pct_unique,
-                }
-            else:
-                col_report["issues"]["uniqueness"] = None
 
-            report[col] = col_report
+def close_engine() -> None:
+    """Close the shared DuckDB connection (a new one is opened on the next call)."""
+    global _CONN
+    with _CONN_LOCK:
+        if _CONN is not None:
+            _CONN.close()
+            _CONN = None
+
+
+def _collect_duckdb(
+    df: pd.DataFrame,
+    custom_numeric_ranges: dict[str, tuple] | None,
+    exact_uniqueness: bool,
+    exact_quantiles: bool,
+    con,
+    use_summarize: bool = False,
+    checks: tuple[str, ...] = ALL_CHECKS,
+    column_sets: tuple[list[str], set[str]] | None = None,
+) -> tuple[dict, dict, dict]:
+    """Run the fused DuckDB queries; returns (stats, thresholds, outlier_counts)."""
+    # a DuckDB connection must not be used from several threads at once, so
+    # each call runs on its own cursor of the shared database
+    own_cursor = con is None
+    if own_cursor:
+        con = _get_conn().cursor()
+    materialize = len(df) >= MATERIALIZE_MIN_ROWS
+    # per-call names, so nothing the caller (or a concurrent call) registered is touched
+    suffix = uuid.uuid4().hex
+    table = f"data_table_{suffix}"
+    view = f"df_view_{suffix}"
+    created = False
+    try:
+        # make the DataFrame available inside DuckDB (via Arrow); large frames
+        # are loaded once into DuckDB's own columnar format, since every query
+        # below scans the whole table
+        if materialize:
+            con.register(view, _to_arrow(df))
+            con.execute(f"CREATE TEMP TABLE {qi(table)} AS SELECT * FROM {qi(view)}")
+            created = True
+            con.unregister(view)
+        else:
+            con.register(table, _to_arrow(df))
+
+        # sections that weren't requested don't get any columns -> no queries
+        column_sets = column_sets or classify_columns(df, checks)
+        numeric_cols, unique_cols = column_sets
+        iqr_cols = iqr_columns(numeric_cols, custom_numeric_ranges)
+
+        # --- fused stats: one scan for missing / non-finite / negative / distinct ---
+        # with SUMMARIZE, approximate distinct counts are left to it (see below)
+        summarize_distinct = use_summarize and not exact_uniqueness
+        stats = fetch_named_row(
+            con,
+            build_stats_query(
+                df,
+                exact_uniqueness,
+                skip_distinct=unique_cols if summarize_distinct else frozenset(),
+                checks=checks,
+                table=table,
+                column_sets=column_sets,
+            ),
+        )
+
+        # --- optional SUMMARIZE: approx distinct counts + approx quartiles in one scan ---
+        summary = {}
+        if use_summarize:
+            wanted = set() if exact_quantiles else set(iqr_cols)
+            if summarize_distinct:
+                wanted |= unique_cols
+            # SUMMARIZE fails on ±inf (and its quartiles would include them)
+            wanted = {col for col in wanted if not stats.get(f"{col}__nonfinite")}
+            try:
+                summary = _collect_summarize(
+                    con, [col for col in df.columns if col in wanted], table
+                )
+            except duckdb.Error:
+                # not supported / failed: fall back to the hand-written queries
+                summary = {}
+
+        if summarize_distinct:
+            for col in unique_cols & summary.keys():
+                stats[f"{col}__nunique"] = summary[col]["approx_unique"]
+            missing_distinct = unique_cols - summary.keys()
+            if missing_distinct:
+                # columns SUMMARIZE didn't cover: count them with the regular query
+                distinct = fetch_named_row(
+                    con,
+                    build_stats_query(
+                        df,
+                        skip_distinct=unique_cols - missing_distinct,
+                        checks=("uniqueness",),
+                        table=table,
+                        column_sets=([], unique_cols),
+                    ),
+                )
+                for col in missing_distinct:
+                    stats[f"{col}__nunique"] = distinct[f"{col}__nunique"]
+
+        # --- numeric columns: one scan for all quartiles, one for all outlier counts ---
+        quantiles = {}
+        if not exact_quantiles:
+            for col in iqr_cols:
+                if col in summary:
+                    q1, q3 = summary[col]["q25"], summary[col]["q75"]
+                    quantiles[col] = None if q1 is None or q3 is None else (float(q1), float(q3))
+        quantiles.update(
+            _collect_numeric_quantiles(
+                con, [col for col in iqr_cols if col not in quantiles], exact_quantiles, table
+            )
+        )
+        thresholds = outlier_thresholds(numeric_cols, quantiles, custom_numeric_ranges)
+        outlier_counts = _collect_numeric_outlier_counts(con, thresholds, table)
 
     finally:
-        con.close()
+        # leave the connection clean for the next call (unregister is a no-op
+        # for names that were never registered)
+        con.unregister(view)
+        if created:
+            con.execute(f"DROP TABLE IF EXISTS {qi(table)}")
+        else:
+            con.unregister(table)
+        if own_cursor:
+            con.close()
+
+    return stats, thresholds, outlier_counts
+
+
+def _collect_np(
+    df: pd.DataFrame,
+    custom_numeric_ranges: dict[str, tuple] | None,
+    checks: tuple[str, ...] = ALL_CHECKS,
+    column_sets: tuple[list[str], set[str]] | None = None,
+) -> tuple[dict, dict, dict]:
+    """
+    Fast path for small frames; returns (stats, thresholds, outlier_counts).
+    Columns are processed concurrently (most NumPy kernels release the GIL).
+    """
+    numeric_cols, unique_cols = column_sets or classify_columns(df, checks)
+    numeric_cols = set(numeric_cols)
+    stats = {"total_rows": len(df)}
+    thresholds = {}
+    outlier_counts = {}
+
+    cols = list(df.dtypes.items())
+    if not cols:
+        return stats, thresholds, outlier_counts
+
+    with ThreadPoolExecutor(max_workers=min(8, len(cols))) as ex:
+        futures = {
+            ex.submit(
+                _process_column_np,
+                col,
+                df[col],
+                dtype,
+                col in numeric_cols,
+                col in unique_cols,
+                (custom_numeric_ranges or {}).get(col),
+                checks,
+            ): col
+            for col, dtype in cols
+        }
+
+        # collect in submission order so the report keeps the column order
+        for future, col in futures.items():
+            col_stats, threshold, counts = future.result()
+            stats.update(col_stats)
+            if threshold is not None:
+                thresholds[col] = threshold
+                outlier_counts[col] = counts
+
+    return stats, thresholds, outlier_counts
+
+
+def check_duckdb_iter(
+    df: pd.DataFrame,
+    custom_numeric_ranges: dict[str, tuple] | None = None,
+    exact_uniqueness: bool = False,
+    exact_quantiles: bool = False,
+    con=None,
+    fast_path_max_rows: int = FAST_PATH_MAX_ROWS,
+    use_summarize: bool = False,
+    checks: tuple[str, ...] = ALL_CHECKS,
+) -> Iterator[tuple[str, dict]]:
+    """
+    Build a column-wise data-quality report for `df` using DuckDB and yield it
+    as (column, column_report) pairs.
+
+    All statistics are computed on the first iteration; the per-column report dicts are only
+    built as the caller consumes them, so very wide reports can be rendered
+    (e.g. with `show_struct`) section by section.
+
+    Uniqueness is estimated with HyperLogLog (`approx_count_distinct`) and
+    reported as "N_unique_approx". The estimate is rough: errors of up to ~20%
+    were observed for 1k-10k distinct values, and a few percent at 1M. It is
+    capped at the row count, so "pct_unique" never exceeds 100. Pass
+    `exact_uniqueness=True` to use COUNT(DISTINCT) instead; the count is then
+    reported as "N_unique".
+
+    IQR quartiles are approximated with a t-digest (`approx_quantile`); pass
+    `exact_quantiles=True` to compute them exactly with `quantile_cont`.
+
+    An existing DuckDB connection can be passed as `con` (don't share it between
+    threads); otherwise each call runs on its own cursor of a shared
+    module-level in-memory connection, which is kept open for later calls
+    (close it with `close_engine()`). Concurrent calls are safe in that case.
+
+    Frames with fewer than `fast_path_max_rows` rows skip DuckDB and are checked
+    with NumPy/pandas directly. Distinct counts and quartiles are then always
+    exact (reported as "N_unique"), so `exact_uniqueness`, `exact_quantiles`
+    and `use_summarize` have no effect there. Set it to 0 to always use DuckDB.
+
+    With `use_summarize=True`, approximate distinct counts and quartiles are
+    taken from one `SUMMARIZE` over the columns that need them. SUMMARIZE
+    doesn't cover the missing / non-finite / negative / outlier rules, so those
+    queries still run (first, so columns containing ±inf, which SUMMARIZE fails
+    on, can be left out of it and computed separately). If SUMMARIZE is
+    unavailable or fails, the regular queries are used.
+
+    `checks` selects the report sections ("missing", "numeric", "uniqueness"; a
+    single name may be passed as a string); sections that aren't listed are
+    neither computed nor included in "issues".
+    """
+    checks = normalize_checks(checks)
+    column_sets = classify_columns(df, checks)
+
+    if len(df) < fast_path_max_rows:
+        stats, thresholds, outlier_counts = _collect_np(
+            df, custom_numeric_ranges, checks, column_sets
+        )
+        # the fast path counts distinct values exactly
+        exact_uniqueness = True
+    else:
+        stats, thresholds, outlier_counts = _collect_duckdb(
+            df,
+            custom_numeric_ranges,
+            exact_uniqueness,
+            exact_quantiles,
+            con,
+            use_summarize,
+            checks,
+            column_sets,
+        )
 
-    return report
+    yield from iter_column_reports(
+        df, stats, thresholds, outlier_counts, exact_uniqueness, checks, column_sets
+    )
+
+
+def check_duckdb(
+    df: pd.DataFrame,
+    custom_numeric_ranges: dict[str, tuple] | None = None,
+    exact_uniqueness: bool = False,
+    exact_quantiles: bool = False,
+    con=None,
+    fast_path_max_rows: int = FAST_PATH_MAX_ROWS,
+    use_summarize: bool = False,
+    checks: tuple[str, ...] = ALL_CHECKS,
+) -> dict:
+    """
+    Build a column-wise data-quality report for `df` using DuckDB.
+    Returns {column: column_report}; see `check_duckdb_iter` for the options.
+    """
+    return dict(
+        check_duckdb_iter(
+            df,
+            custom_numeric_ranges,
+            exact_uniqueness=exact_uniqueness,
+            exact_quantiles=exact_quantiles,
+            con=con,
+            fast_path_max_rows=fast_path_max_rows,
+            use_summarize=use_summarize,
+            checks=checks,
+        )
+    )
 
 
-def fix_duckdb(df: pd.DataFrame) -> pd.DataFrame:
+def fix_duckdb(df: pd.DataFrame, con=None) -> pd.DataFrame:
     """
     Placeholder for future cleaning logic.
     For now it just returns the original DataFrame unchanged.
+
+    Like `check_duckdb`, it will run on `con` or the shared connection.
     """
-    return df
\ No newline at end of file
+    return df
@@ -0,0 +1,190 @@
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from .common import (
+    ALL_CHECKS,
+    NULL_LIKE_STRINGS,
+    classify_columns,
+    iqr_columns,
+    iter_column_reports,
+    missing_kind,
+    normalize_checks,
+    outlier_thresholds,
+)
+
+
+# -------------------
+# Helper Functions
+# -------------------
+
+def build_missing_expr(col: str, dtype) -> pl.Expr:
+    """
+    Return a Polars boolean expression that is TRUE when the value is considered "missing".
+    Same rules as `duckdb_engine.build_missing_condition` (NaN arrives as null).
+    """
+    c = pl.col(col)
+
+    if isinstance(dtype, pd.CategoricalDtype) or missing_kind(dtype) == "O":
+        # strings / categoricals: null, empty, or typical "null-like" markers
+        stripped = c.cast(pl.String).str.strip_chars(" ")  # only spaces, like trim()
+        return (
+            c.is_null()
+            | (stripped == "")
+            | stripped.str.to_lowercase().is_in(list(NULL_LIKE_STRINGS))
+        )
+
+    if missing_kind(dtype) == "f":
+        # floats: null or NaN
+        return c.is_null() | c.is_nan()
+
+    return c.is_null()
+
+
+def build_stats_exprs(
+    df: pd.DataFrame,
+    exact_uniqueness: bool = False,
+    checks: tuple[str, ...] = ALL_CHECKS,
+    column_sets: tuple[list[str], set[str]] | None = None,
+) -> list[pl.Expr]:
+    """
+    Polars counterpart of `duckdb_engine.build_stats_query`: one expression per
+    statistic, aliased "<col>__<stat>", evaluated together in a single `select`.
+    `column_sets` is the caller's `classify_columns` result (computed here if
+    not given).
+    """
+    numeric_cols, unique_cols = column_sets or classify_columns(df, checks)
+    numeric_cols = set(numeric_cols)
+    exprs = [pl.len().alias("total_rows")]
+
+    for col, dtype in df.dtypes.items():
+        c = pl.col(col)
+        if "missing" in checks:
+            exprs.append(build_missing_expr(col, dtype).sum().alias(f"{col}__missing"))
+
+        if col in numeric_cols:
+            cf = c.cast(pl.Float64)
+            exprs.append(cf.is_infinite().sum().alias(f"{col}__nonfinite"))
+            exprs.append((cf < 0).sum().alias(f"{col}__neg"))
+
+        if col in unique_cols:
+            distinct = c.drop_nulls().n_unique() if exact_uniqueness else c.drop_nulls().approx_n_unique()
+            exprs.append(distinct.alias(f"{col}__nunique"))
+
+    return exprs
+
+
+def _to_polars(df: pd.DataFrame) -> pl.DataFrame:
+    """
+    Convert the DataFrame to Polars. Object columns with mixed types (which
+    Arrow can't convert) are cast to strings first, keeping NULL / NaN as null.
+    """
+    try:
+        return pl.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+
+    converted = df.copy(deep=False)
+    for col, dtype in df.dtypes.items():
+        if dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            converted[col] = df[col].astype("string")
+    return pl.from_pandas(converted)
+
+
+def _collect_numeric_quantiles(lf: pl.LazyFrame, numeric_cols: list[str]) -> dict[str, tuple[float, float] | None]:
+    """q1/q3 (finite, non-null values only, linear interpolation) for all given columns at once."""
+    if not numeric_cols:
+        return {}
+
+    exprs = []
+    for col in numeric_cols:
+        cf = pl.col(col).cast(pl.Float64)
+        finite = cf.filter(cf.is_finite())
+        exprs.append(finite.quantile(0.25, "linear").alias(f"{col}__q1"))
+        exprs.append(finite.quantile(0.75, "linear").alias(f"{col}__q3"))
+    row = lf.select(exprs).collect().row(0, named=True)
+
+    quantiles = {}
+    for col in numeric_cols:
+        q1, q3 = row[f"{col}__q1"], row[f"{col}__q3"]
+        quantiles[col] = None if q1 is None or q3 is None else (float(q1), float(q3))
+    return quantiles
+
+
+def _collect_numeric_outlier_counts(
+    lf: pl.LazyFrame,
+    thresholds: dict[str, tuple[str, float, float]],
+) -> dict[str, tuple[int, int, int]]:
+    """Finite / below / above counts for all given columns at once."""
+    if not thresholds:
+        return {}
+
+    exprs = []
+    for col, (_, lower_thresh, upper_thresh) in thresholds.items():
+        cf = pl.col(col).cast(pl.Float64)
+        finite = cf.filter(cf.is_finite())
+        exprs.append(finite.len().alias(f"{col}__finite"))
+        exprs.append((finite < lower_thresh).sum().alias(f"{col}__below"))
+        exprs.append((finite > upper_thresh).sum().alias(f"{col}__above"))
+    row = lf.select(exprs).collect().row(0, named=True)
+
+    return {
+        col: (int(row[f"{col}__finite"]), int(row[f"{col}__below"]), int(row[f"{col}__above"]))
+        for col in thresholds
+    }
+
+
+# -----------------------
+# Main engine functions
+# -----------------------
+
+def check_polars(
+    df: pd.DataFrame,
+    custom_numeric_ranges: dict[str, tuple] | None = None,
+    exact_uniqueness: bool = False,
+    exact_quantiles: bool = False,
+    checks: tuple[str, ...] = ALL_CHECKS,
+) -> dict:
+    """
+    Build the same column-wise data-quality report as `check_duckdb`, computed
+    with Polars' expression engine on the Arrow buffers (no SQL).
+
+    Uniqueness is estimated with `approx_n_unique` and reported as
+    "N_unique_approx", unless `exact_uniqueness=True`. IQR quartiles are always
+    exact; `exact_quantiles` is accepted for compatibility with `check_duckdb`
+    and has no effect. `checks` selects the report sections, as in `check_duckdb`.
+
+    Object columns with mixed types are checked as strings.
+    """
+    checks = normalize_checks(checks)
+    lf = _to_polars(df).lazy()
+
+    column_sets = classify_columns(df, checks)
+    numeric_cols = column_sets[0]
+    stats = (
+        lf.select(build_stats_exprs(df, exact_uniqueness, checks, column_sets))
+        .collect()
+        .row(0, named=True)
+    )
+
+    quantiles = _collect_numeric_quantiles(lf, iqr_columns(numeric_cols, custom_numeric_ranges))
+    thresholds = outlier_thresholds(numeric_cols, quantiles, custom_numeric_ranges)
+    outlier_counts = _collect_numeric_outlier_counts(lf, thresholds)
+
+    return dict(
+        iter_column_reports(
+            df, stats, thresholds, outlier_counts, exact_uniqueness, checks, column_sets
+        )
+    )
+
+
+def fix_polars(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Placeholder for future cleaning logic.
+    For now it just returns the original DataFrame unchanged.
+    """
+    return df
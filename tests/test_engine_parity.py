@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from bigdata_cleaning.duckdb_engine import check_duckdb
+from bigdata_cleaning.polars_engine import check_polars
+
+
+def make_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": ["\t", "\n", "a", " ", " null ", None, "", "b"],
+            "score": [1.5, np.nan, np.inf, -np.inf, -2.0, 3.0, 100.0, 0.0],
+            "count": [1, 2, 3, 4, 5, 6, 7, 80],
+            "user_id": [1, 1, 2, 3, 4, 5, 6, 6],
+            "kind": pd.Categorical(["x", "\t", "null", None, "y", "x", " ", "y"]),
+            "half": np.array([0.5, np.nan, np.inf, -1.0, 2.0, 2.5, 3.0, 40.0], dtype="float16"),
+            "wait": pd.to_timedelta([1, None, 3, 4, 5, 6, 7, 8], unit="s").astype("timedelta64[s]"),
+        }
+    )
+
+
+def test_fast_path_matches_duckdb():
+    df = make_frame()
+    fast = check_duckdb(df)
+    duck = check_duckdb(
+        df, exact_uniqueness=True, exact_quantiles=True, fast_path_max_rows=0
+    )
+    assert fast == duck
+
+
+def test_polars_matches_duckdb():
+    df = make_frame()
+    duck = check_duckdb(
+        df, exact_uniqueness=True, exact_quantiles=True, fast_path_max_rows=0
+    )
+    assert check_polars(df, exact_uniqueness=True) == duck
+
+
+def test_whitespace_is_trimmed_like_duckdb():
+    values = ["\t", "\n", "a", " ", " null "]
+    df = pd.DataFrame({"s": values, "c": pd.Categorical(values)})
+    reports = [check_duckdb(df), check_duckdb(df, fast_path_max_rows=0), check_polars(df)]
+    for report in reports:
+        assert report["s"]["issues"]["missing_values"]["N_missing"] == 2
+        assert report["c"]["issues"]["missing_values"]["N_missing"] == 2
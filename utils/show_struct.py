@@ -4,8 +4,10 @@ Helper for pretty-printing nested Python objects as collapsible YAML/JSON in Jup
 
 from __future__ import annotations
 
+import json
 import math
-from pprint import pformat
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 import html as _html  # for HTML escaping
 
@@ -14,6 +16,11 @@ import pandas as pd
 import yaml
 from IPython.display import HTML, display
 
+try:
+    import orjson  # optional: fast JSON serializer with native numpy support
+except ImportError:
+    orjson = None
+
 
 def _coerce(value: Any) -> Any:
     """
@@ -50,13 +57,111 @@ def _coerce(value: Any) -> Any:
     return value
 
 
-class _SafeDumper(yaml.SafeDumper):
-    """Custom YAML dumper that understands numpy scalar types."""
+# use the libyaml C emitter when available
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper
+
+
+class _SafeDumper(_BaseDumper):
+    """Custom YAML dumper that understands numpy / pandas scalar types."""
+
+
+def _represent_float(dumper: yaml.SafeDumper, value: float) -> yaml.Node:
+    # NaN is shown as null, like missing values
+    if math.isnan(value):
+        return dumper.represent_none(None)
+    return dumper.represent_float(value)
+
+
+# any numpy scalar (integer, floating, bool_, ...) -> the matching builtin
+_SafeDumper.add_multi_representer(np.generic, lambda d, v: d.represent_data(v.item()))
+_SafeDumper.add_representer(float, _represent_float)
+_SafeDumper.add_representer(pd.Timestamp, lambda d, v: d.represent_str(v.isoformat()))
+_SafeDumper.add_representer(pd.Timedelta, lambda d, v: d.represent_str(str(v)))
+_SafeDumper.add_representer(type(pd.NA), lambda d, v: d.represent_none(None))
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values orjson can't serialize natively (pandas scalars etc.)."""
+    coerced = _coerce(value)
+    return str(value) if coerced is value else coerced
+
+
+def _prepare(value: Any, kind: str) -> Any:
+    """
+    Coerce values for serialization. Only needed for the stdlib JSON fallback;
+    the YAML dumper and orjson handle numpy / pandas scalars themselves.
+    """
+    if kind == "yaml" or orjson is not None:
+        return value
+    return _coerce(value)
+
+
+def _format(value: Any, kind: str, width: int) -> str:
+    """Render a single (prepared) value as YAML or JSON."""
+    if kind == "yaml":
+        return yaml.dump(
+            value,
+            Dumper=_SafeDumper,
+            sort_keys=False,
+            allow_unicode=True,
+            width=width,
+            indent=2,
+        )
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        try:
+            return orjson.dumps(value, default=_json_default, option=option).decode()
+        except TypeError:
+            # `default` isn't applied to dict keys (e.g. numpy integers), and
+            # orjson.JSONEncodeError is a TypeError: coerce and use the stdlib
+            value = _coerce(value)
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str)
+
+
+@lru_cache(maxsize=16_384, typed=True)  # typed: 1, 1.0 and True are distinct keys
+def _escape_key(key: Any) -> str:
+    return _html.escape(str(key))
+
+
+def _scalar_text(value: Any, kind: str) -> str | None:
+    """
+    Render a builtin scalar without a full YAML/JSON dump, or return None if it
+    needs one. Exact types only: numpy scalars (e.g. np.float64, a float
+    subclass) go through the dumpers.
+    """
+    if type(value) not in (int, float, str, bool, type(None)):
+        return None
+    if type(value) is float and math.isnan(value):
+        value = None  # NaN is shown as null, like missing values
+
+    if kind != "yaml":
+        return json.dumps(value, ensure_ascii=False)
+    if value is None:
+        return "null"
+    if type(value) is bool:
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    return None  # floats / strings follow YAML's formatting and quoting rules
+
 
+def _section_html(key: Any, value: Any, kind: str, width: int) -> str:
+    """Build one collapsible <details> section for a top-level key."""
+    # plain scalars don't need a YAML/JSON dump
+    text = _scalar_text(value, kind)
+    if text is None:
+        text = _format(value, kind, width)
+    body_html = _html.escape(text)
 
-_SafeDumper.add_multi_representer(np.integer, lambda d, v: d.represent_int(int(v)))
-_SafeDumper.add_multi_representer(np.floating, lambda d, v: d.represent_float(float(v)))
-_SafeDumper.add_representer(np.bool_, lambda d, v: d.represent_bool(bool(v)))
+    return f"""
+<details>
+  <summary><code>{_escape_key(key)}</code></summary>
+  <pre>{body_html}</pre>
+</details>
+"""
 
 
 def show_struct(obj: Any, kind: str = "yaml", width: int = 140) -> None:
@@ -70,56 +175,29 @@ def show_struct(obj: Any, kind: str = "yaml", width: int = 140) -> None:
     ----------
     obj : Any
         The object to display (ideally a dict: {column_name: info, ...}).
+        An iterator of (key, value) pairs (e.g. from `check_duckdb_iter`) is
+        rendered section by section as the pairs arrive.
     kind : {"yaml", "json"}, default "yaml"
-        Output format for each section.
+        Output format for each section. JSON uses `orjson` if it is installed.
     width : int, default 140
-        Wrap width for the printed output.
+        Wrap width for the YAML output.
     """
-    data = _coerce(obj)
+    # Stream (key, value) pairs: display each section as soon as it is built.
+    if isinstance(obj, Iterator):
+        for key, value in obj:
+            section = _section_html(key, _prepare(value, kind), kind, width)
+            display(HTML(f"<div style='font-family: monospace'>{section}</div>"))
+        return
+
+    data = _prepare(obj, kind)
 
     # If it's not a dict, just fall back to a single block.
     if not isinstance(data, dict):
-        if kind == "yaml":
-            text = yaml.dump(
-                data,
-                Dumper=_SafeDumper,
-                sort_keys=False,
-                allow_unicode=True,
-                width=width,
-                indent=2,
-            )
-        else:
-            text = pformat(data, width=width, compact=True)
-
+        text = _format(data, kind, width)
         display(HTML(f"<pre>{_html.escape(text)}</pre>"))
         return
 
-    # Build collapsible HTML for each top-level key
-    sections = []
-    for key, value in data.items():
-        if kind == "yaml":
-            body = yaml.dump(
-                value,
-                Dumper=_SafeDumper,
-                sort_keys=False,
-                allow_unicode=True,
-                width=width,
-                indent=2,
-            )
-        else:
-            body = pformat(value, width=width, compact=True)
-
-        key_html = _html.escape(str(key))
-        body_html = _html.escape(body)
-
-        sections.append(
-            f"""
-<details>
-  <summary><code>{key_html}</code></summary>
-  <pre>{body_html}</pre>
-</details>
-"""
-        )
-
+    # Build collapsible HTML for each top-level key, joined once
+    sections = [_section_html(key, value, kind, width) for key, value in data.items()]
     html = "<div style='font-family: monospace'>" + "\n".join(sections) + "</div>"
-    display(HTML(html))
\ No newline at end of file
+    display(HTML(html))